@@ -1,10 +1,11 @@
 """The main functionality of `validating-base`."""
 from __future__ import annotations
 
+import inspect
 from abc import ABCMeta
 from typing import TYPE_CHECKING, Any
 
-from validating_base.decorators_internal import prerun_validated, type_validated, validate_init
+from validating_base.decorators_internal import is_validated_method, validate_init, validated_method
 
 if TYPE_CHECKING:
     from .types import C
@@ -19,13 +20,18 @@ def ensure_required_attributes(cls: C) -> C:
 
 
 def update_init(cls: C) -> C:
-    """Install the validate_init decorator on `__init__`."""
-    cls.__init__ = validate_init(cls.__init__)  # type: ignore[misc]
+    """Install the validate_init decorator on `__init__`.
+
+    If the class inherits an `__init__` that already has the decorator installed, it's left as it is, so that
+    inheriting from a class doesn't add another layer of wrapping to every instantiation.
+    """
+    if not getattr(cls.__init__, "__is_validate_init__", False):  # type: ignore[misc]
+        cls.__init__ = validate_init(cls.__init__)  # type: ignore[misc]
     return cls
 
 
 def update_validated_methods(cls: C) -> C:
-    """Update the `__prerun_validated_methods__` and `__type_validated_methods__` attributes."""
+    """Update the `__prerun_validated_methods__`, `__type_validated_methods__` and `__validator_names__` attributes."""
     prerun_validated_methods = set()
     type_validated_methods = set()
 
@@ -47,6 +53,47 @@ def update_validated_methods(cls: C) -> C:
 
     cls.__prerun_validated_methods__ = frozenset(prerun_validated_methods)  # type: ignore[attr-defined]
     cls.__type_validated_methods__ = frozenset(type_validated_methods)  # type: ignore[attr-defined]
+
+    # Work out the validator names up front, so they aren't rebuilt for every instance.
+    validator_names = {name: f"validate_{name}" for name in prerun_validated_methods}
+    cls.__validator_names__ = validator_names  # type: ignore[attr-defined]
+    return cls
+
+
+def install_validated_methods(cls: C) -> C:
+    """Wrap the validated methods of the class with their validation decorators.
+
+    The wrapping is done once when the class is created, rather than every time the method is accessed.
+    Each method is looked up along the MRO, so implementations that come from a mixin are wrapped too.
+    Methods that have already been wrapped when a parent class was created are left as they are.
+
+    Raises:
+        TypeError: Raised if a validated method isn't something that can be wrapped, or if a prerun validated
+            classmethod or staticmethod has a validation method that isn't a classmethod or staticmethod.
+    """
+    type_validated_methods = cls.__type_validated_methods__  # type: ignore[attr-defined]
+
+    for name in cls.__prerun_validated_methods__ | type_validated_methods:  # type: ignore[attr-defined]
+        method = inspect.getattr_static(cls, name, None)
+        validator_name = cls.__validator_names__.get(name)  # type: ignore[attr-defined]
+
+        # Classmethods and staticmethods don't have an instance to call the validation method on.
+        # This is checked for every class, as a subclass could override the validation method.
+        if isinstance(method, (classmethod, staticmethod)) and validator_name is not None:
+            validator = inspect.getattr_static(cls, validator_name, None)
+
+            if validator is not None and not isinstance(validator, (classmethod, staticmethod)):
+                raise TypeError(
+                    f"The {validator_name} method must be a classmethod or staticmethod, because {name} is one."
+                )
+
+        if method is None or is_validated_method(method, cls):  # type: ignore[arg-type]
+            continue
+
+        # Methods with both kinds of validation get a single wrapper which does both.
+        method = validated_method(method, name, cls, validator_name, name in type_validated_methods)  # type: ignore
+        setattr(cls, name, method)
+
     return cls
 
 
@@ -75,6 +122,7 @@ class ValidatingBaseClassMeta(ABCMeta):
         new_class = ensure_required_attributes(new_class)
         new_class = update_init(new_class)
         new_class = update_validated_methods(new_class)
+        new_class = install_validated_methods(new_class)
 
         return new_class
 
@@ -93,27 +141,38 @@ class ValidatingBaseClass(metaclass=ValidatingBaseClassMeta):
     _self_validated: bool
     """Internal flag to indicate whether the class itself has been validated."""
 
-    def _validate_self(self) -> None:
+    __prerun_validated_methods__: frozenset[str]
+    """The names of the methods which are validated by their `validate_XXX` method."""
+
+    __type_validated_methods__: frozenset[str]
+    """The names of the methods which have their argument and return types validated."""
+
+    __validator_names__: dict[str, str]
+    """The name of the `validate_XXX` method for each of the `__prerun_validated_methods__`."""
+
+    _class_validated: bool
+    """Internal flag, set in a class's own `__dict__`, to indicate that `_validate_class` has passed for it."""
+
+    @classmethod
+    def _validate_class(cls: type[ValidatingBaseClass]) -> None:
         """Validate that the class has the specified methods defined.
 
         Raises:
             NotImplementedError: Raised if a method is not defined.
         """
-        if getattr(self, "validated_methods", None) is not None:
+        if getattr(cls, "validated_methods", None) is not None:
             raise DeprecationWarning(
                 "The validated_methods attribute is deprecated. Use the `validating_base.validated` decorator instead."
             )
 
-        if getattr(self, "required_methods", None) is not None:
+        if getattr(cls, "required_methods", None) is not None:
             raise DeprecationWarning(
                 "The required_methods attribute is deprecated. Use the `abc.abstractmethod` decorator instead."
             )
 
-        for validated_method_name in self.__prerun_validated_methods__:
+        for validated_method_name, validator_name in cls.__validator_names__.items():
             # check that the validate method exists for this method
-
-            validator_name = f"validate_{validated_method_name}"
-            validator_method = getattr(self, validator_name, None)
+            validator_method = getattr(cls, validator_name, None)
 
             if validator_method is None:
                 raise NotImplementedError(
@@ -123,22 +182,16 @@ class ValidatingBaseClass(metaclass=ValidatingBaseClassMeta):
             if not callable(validator_method):
                 raise TypeError(f"The {validator_name} attribute must be a callable.")
 
-        self._self_validated = True
-
-    def __getattribute__(self, __name: str) -> Any:
-        """Get an attribute from the class, and decorate any validated methods with their validation methods.."""
-        method = super().__getattribute__(__name)
-
-        if __name in ["_self_validated", "__prerun_validated_methods__", "__type_validated_methods__"]:
-            return method
+    def _validate_self(self) -> None:
+        """Validate that the class has the specified methods defined.
 
-        if callable(method) and self._self_validated:
-            if __name in self.__prerun_validated_methods__:
-                validator_name = f"validate_{__name}"
-                validator = super().__getattribute__(validator_name)
-                method = prerun_validated(validator)(method)
+        The result only depends on the class, so `_validate_class` is only run for the first instance of each class.
+        The flag is looked up in the class's own `__dict__`, so subclasses don't inherit it from their parents.
+        """
+        cls = type(self)
 
-            if __name in self.__type_validated_methods__:
-                method = type_validated(method)
+        if not cls.__dict__.get("_class_validated", False):
+            cls._validate_class()
+            cls._class_validated = True
 
-        return method
+        self._self_validated = True
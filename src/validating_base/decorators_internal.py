@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import inspect
-import sys
+import itertools
+import os
 from functools import wraps
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from typeguard import TypeCheckMemo
 from typeguard._functions import check_argument_types, check_return_type
@@ -13,7 +14,34 @@ if TYPE_CHECKING:
     from typing_extensions import Concatenate
 
     from .base import ValidatingBaseClass
-    from .types import P, R
+    from .types import MethodKind, P, R
+
+
+def read_sample_every() -> int:
+    """Read the `VALIDATING_BASE_SAMPLE_EVERY` environment variable.
+
+    Raises:
+        ValueError: Raised if the environment variable isn't an integer.
+
+    Returns:
+        int: The value of the environment variable, or 1 if it isn't set. Values below 1 are treated as 1.
+    """
+    value = os.environ.get("VALIDATING_BASE_SAMPLE_EVERY", "1")
+
+    try:
+        return max(1, int(value))
+    except ValueError:
+        raise ValueError(
+            f"The VALIDATING_BASE_SAMPLE_EVERY environment variable must be an integer, not {value!r}."
+        ) from None
+
+
+SAMPLE_EVERY = read_sample_every()
+"""Only type check one in every `SAMPLE_EVERY` calls to each type validated method.
+
+Set using the `VALIDATING_BASE_SAMPLE_EVERY` environment variable. Defaults to 1, which checks every call.
+The environment variable is read once, when `validating_base` is imported, so it needs setting before then.
+"""
 
 
 def validate_init(
@@ -27,67 +55,436 @@ def validate_init(
             self._validate_self()
         return function(self, *args, **kwargs)
 
+    inner.__is_validate_init__ = True  # type: ignore[attr-defined]
     return inner
 
 
-def prerun_validated(validation_method: Callable[P, None]) -> Callable[[Callable[P, R]], Callable[P, R]]:
-    """Validate the decorated method with the supplied validation method.
+def prerun_validated(
+    validator_name: str,
+) -> Callable[[Callable[Concatenate[Any, P], R]], Callable[Concatenate[Any, P], R]]:
+    """Validate the decorated method with the validation method of the supplied name.
 
+    The validation method is looked up on the instance that the decorated method is called on, so subclasses can
+    override it without redefining the decorated method.
     The validation method must be a method that accepts the same parameters as the decorated method.
     The validation method raise an exception if there's any validation errors.
 
     Args:
-        validation_method (Callable[P, None]): The method to call to validated the decorated method.
+        validator_name (str): The name of the method to call to validated the decorated method.
     """
 
-    def outer(function: Callable[P, R]) -> Callable[P, R]:
-        @wraps(function)
-        def inner(*args: P.args, **kwargs: P.kwargs) -> R:
-            validation_method(*args, **kwargs)
-            return function(*args, **kwargs)
-
-        return inner
+    def outer(function: Callable[Concatenate[Any, P], R]) -> Callable[Concatenate[Any, P], R]:
+        return _build_validated(function, None, validator_name, check_types=False)
 
     return outer
 
 
-def type_validated(function: Callable[P, R]) -> Callable[P, R]:
-    """Validate the argument and return types of the decorated method.
+_MISSING = object()
+"""Stands in for the default of each parameter in a generated argument checker, to tell if an argument was passed."""
+
+
+def _generate_argument_checker(
+    function_name: str, signature: inspect.Signature, annotations: dict[str, Any], memo: TypeCheckMemo
+) -> Callable[..., None] | None:
+    """Generate a function which checks the argument types, with exactly the same parameters as the decorated method.
+
+    With the parameters spelled out, the interpreter matches up the arguments itself, so they don't need binding
+    with `inspect.Signature.bind` on every call.
 
-    If used in conjunction with `prerun_validated`, this should be executed 2nd.
+    Args:
+        function_name (str): The name of the method to validate.
+        signature (inspect.Signature): The signature of the method.
+        annotations (dict[str, Any]): The expected type of each annotated argument.
+        memo (TypeCheckMemo): The memo to pass to typeguard.
+
+    Returns:
+        Callable[..., None] | None: The checker, or None if the signature can't be specialised (e.g. a parameter name
+            clashes with one used by the checker).
     """
+    # Everything the generated code uses is passed in as a global, prefixed so it doesn't clash with a parameter.
+    namespace: dict[str, Any] = {
+        "__missing": _MISSING,
+        "__function_name": function_name,
+        "__memo": memo,
+        "__check_argument_types": check_argument_types,
+    }
 
-    @wraps(function)
-    def inner(*args: P.args, **kwargs: P.kwargs) -> R:
-        # Get the decorated function's name
-        function_name = function.__name__
+    parameters = []
+    required_checks = []
+    optional_checks = []
+    previous_kind = None
+
+    for index, (name, parameter) in enumerate(signature.parameters.items()):
+        if name in namespace or name == "__arguments":
+            return None
+
+        # Keep the `/` and `*` markers so that arguments can only be passed in the same way as before.
+        if previous_kind is parameter.POSITIONAL_ONLY and parameter.kind is not parameter.POSITIONAL_ONLY:
+            parameters.append("/")
+
+        if parameter.kind is parameter.KEYWORD_ONLY and previous_kind not in (
+            parameter.KEYWORD_ONLY,
+            parameter.VAR_POSITIONAL,
+        ):
+            parameters.append("*")
+
+        previous_kind = parameter.kind
+
+        if parameter.kind is parameter.VAR_POSITIONAL:
+            parameters.append(f"*{name}")
+        elif parameter.kind is parameter.VAR_KEYWORD:
+            parameters.append(f"**{name}")
+        elif parameter.default is parameter.empty:
+            parameters.append(name)
+        else:
+            # Defaults are replaced by a sentinel, so the checker can tell which arguments were actually passed.
+            parameters.append(f"{name}=__missing")
+
+        if name in annotations:
+            namespace[f"__annotation_{index}"] = annotations[name]
+
+            if parameter.default is parameter.empty:
+                required_checks.append(f"{name!r}: ({name}, __annotation_{index})")
+            else:
+                # As with `Signature.bind`, arguments that aren't passed (and so are left as their default) aren't
+                # checked, but arguments that are passed are, even if they're the same as the default.
+                optional_checks.append(f"    if {name} is not __missing:")
+                optional_checks.append(f"        __arguments[{name!r}] = ({name}, __annotation_{index})")
+
+    if previous_kind is inspect.Parameter.POSITIONAL_ONLY:
+        parameters.append("/")
+
+    lines = [f"def __check_arguments({', '.join(parameters)}):"]
+    lines.append(f"    __arguments = {{{', '.join(required_checks)}}}")
+    lines.extend(optional_checks)
+    lines.append("    __check_argument_types(__function_name, __arguments, __memo)")
+
+    source = "\n".join(lines) + "\n"
+    exec(compile(source, f"<validating_base arguments {function_name}>", "exec"), namespace)
+    checker: Callable[..., None] = namespace["__check_arguments"]
+    return checker
 
-        # This is bascially getting the arguments and typehints for the function.
-        signature = inspect.signature(function)
 
+def _bind_argument_checker(
+    function_name: str, signature: inspect.Signature, annotations: dict[str, Any], memo: TypeCheckMemo
+) -> Callable[..., None]:
+    """Build a function which checks the argument types by binding them to the signature on every call.
+
+    This is used when `_generate_argument_checker` can't generate a checker for the signature.
+
+    Args:
+        function_name (str): The name of the method to validate.
+        signature (inspect.Signature): The signature of the method.
+        annotations (dict[str, Any]): The expected type of each annotated argument.
+        memo (TypeCheckMemo): The memo to pass to typeguard.
+    """
+
+    def check_arguments(*args: Any, **kwargs: Any) -> None:
         # This is like matching up the values in args and kwargs to the signature we just got.
         bound_args = signature.bind(*args, **kwargs).arguments
 
-        # This lets us see all of the variables that are accessible in this function.
-        frame = sys._getframe(0)
+        # Convert the bound arguments into the format that typeguard expects
+        # (dict[str, tuple[Any, Any]]): dict[`argument_name`, tuple[`argument_value`, `argument_expected_type`]]
+        formatted_args = {
+            name: (value, annotations[name]) for name, value in bound_args.items() if name in annotations
+        }
 
-        # TypeCheckMemo is just typeguard's storage for info about an object.
-        memo = TypeCheckMemo(frame.f_globals, frame.f_locals, self_type=type(function))
+        check_argument_types(function_name, formatted_args, memo)
 
-        # Convert the signature parameters into the format that typeguard expects
-        # (dict[str, tuple[Any, Any]]): dict[`argument_name`, tuple[`argument_value`, `argument_expected_type`]]
-        formatted_args = {}
+    return check_arguments
 
-        for (expected_name, expected_type), actual_value in zip(signature.parameters.items(), bound_args.values()):
-            formatted_args[expected_name] = (actual_value, expected_type.annotation)
 
-        # Use typeguard to check the types, and then run the validation method if it exists.
-        check_argument_types(function_name, formatted_args, memo)
+def _generate_validated(
+    function: Callable[P, R],
+    check_arguments: Callable[..., None] | None,
+    memo: TypeCheckMemo,
+    validator_name: str | None,
+    sample_every: int,
+    return_annotation: Any,
+    check_return: bool,
+    kind: MethodKind,
+    owner: type | None,
+    method_name: str | None,
+) -> Callable[P, R]:
+    """Generate the validating wrapper, with only the steps that the method needs.
+
+    The wrapper passes the arguments on to the argument checker, the validation method and the method itself in
+    exactly the same way that they were passed to the wrapper.
 
-        # run the function, and then check that the return type is valid
-        res = function(*args, **kwargs)
-        check_return_type(function_name, res, signature.return_annotation, memo)
+    Args:
+        function (Callable[P, R]): The method to validate.
+        check_arguments (Callable[..., None] | None): The argument checker, if any arguments need type checking.
+        memo (TypeCheckMemo): The memo to pass to typeguard.
+        validator_name (str | None): The name of the validation method to call on `self`, if there is one.
+        sample_every (int): Only type check one in every `sample_every` calls.
+        return_annotation (Any): The return annotation of the method.
+        check_return (bool): Whether the return value needs type checking.
+        kind (MethodKind): Whether the method is a normal method, a classmethod or a staticmethod.
+        owner (type | None): The class that a staticmethod looks up its validation method on.
+        method_name (str | None): The name that the method is installed under, if it's installed on a class.
+    """
+    function_name = function.__name__
 
-        return res
+    # Everything the generated code uses is passed in as a global, prefixed so it doesn't clash with the method name.
+    namespace: dict[str, Any] = {
+        "__function": function,
+        "__function_name": function_name,
+        "__check_arguments": check_arguments,
+        "__return_annotation": return_annotation,
+        "__memo": memo,
+        "__check_return_type": check_return_type,
+        "__getattr": getattr,
+        "__type": type,
+        "__next": next,
+        "__method_name": method_name,
+        "__validator_name": validator_name,
+        "__owner": owner,
+        "__sample_every": sample_every,
+        "__calls": itertools.count(),
+    }
 
-    return inner
+    wrapper_name = function_name if function_name.isidentifier() and function_name not in namespace else "inner"
+
+    # The validation method is looked up on `self` (the first argument), and passed the rest of the arguments.
+    # Static methods don't have a `self`, so they look it up on the class they were installed on instead.
+    uses_self = kind != "staticmethod" and (validator_name is not None or method_name is not None)
+
+    if uses_self:
+        lines = [f"def {wrapper_name}(__self, /, *__args, **__kwargs):"]
+        call_arguments = "__self, *__args, **__kwargs"
+    else:
+        lines = [f"def {wrapper_name}(*__args, **__kwargs):"]
+        call_arguments = "*__args, **__kwargs"
+
+    validator_call = None
+
+    if validator_name is not None and kind == "staticmethod":
+        validator_call = "__getattr(__owner, __validator_name)(*__args, **__kwargs)"
+    elif validator_name is not None:
+        validator_call = "__getattr(__self, __validator_name)(*__args, **__kwargs)"
+
+    # When an override calls the method through `super()`, the override's wrapper has already done the validation.
+    # So the validation is skipped unless this is the wrapper that the class of `self` resolves the name to.
+    if uses_self and method_name is not None:
+        if kind == "classmethod":
+            lines.append("    __resolved = __getattr(__getattr(__self, __method_name, None), '__func__', None)")
+        else:
+            lines.append("    __resolved = __getattr(__type(__self), __method_name, None)")
+
+        lines.append("    if __resolved is not __wrapper and __getattr(__resolved, '__is_validated_method__', False):")
+        lines.append(f"        return __function({call_arguments})")
+
+    # Calls that aren't being sampled skip straight past the type checks (but still get validated).
+    if sample_every > 1:
+        lines.append("    if __next(__calls) % __sample_every:")
+        if validator_call is not None:
+            lines.append(f"        {validator_call}")
+        lines.append(f"        return __function({call_arguments})")
+
+    # If none of the arguments are annotated, there's nothing to pass to typeguard.
+    if check_arguments is not None:
+        lines.append(f"    __check_arguments({call_arguments})")
+
+    if validator_call is not None:
+        lines.append(f"    {validator_call}")
+
+    # Without a return annotation there's nothing to check, so the result can be returned directly.
+    if not check_return:
+        lines.append(f"    return __function({call_arguments})")
+    elif return_annotation is None:
+        # `-> None` methods almost always return None, which doesn't need typeguard to check it.
+        lines.append(f"    __result = __function({call_arguments})")
+        lines.append("    if __result is not None:")
+        lines.append("        __check_return_type(__function_name, __result, __return_annotation, __memo)")
+        lines.append("    return __result")
+    else:
+        lines.append(f"    __result = __function({call_arguments})")
+        lines.append("    __check_return_type(__function_name, __result, __return_annotation, __memo)")
+        lines.append("    return __result")
+
+    source = "\n".join(lines) + "\n"
+    exec(compile(source, f"<validating_base validated {function_name}>", "exec"), namespace)
+    wrapper: Callable[P, R] = wraps(function)(namespace[wrapper_name])
+    wrapper.__is_validated_method__ = True  # type: ignore[attr-defined]
+    namespace["__wrapper"] = wrapper
+    return wrapper
+
+
+def type_validated(function: Callable[P, R], self_type: type | None = None) -> Callable[P, R]:
+    """Validate the argument and return types of the decorated method.
+
+    If used in conjunction with `prerun_validated`, this should be executed 2nd (or use `prerun_type_validated`).
+
+    Args:
+        function (Callable[P, R]): The method to validate.
+        self_type (type | None): The class that the method is defined on, used to check `Self` annotations.
+    """
+    return _build_validated(function, self_type, None)
+
+
+def prerun_type_validated(
+    validator_name: str, self_type: type | None = None
+) -> Callable[[Callable[Concatenate[Any, P], R]], Callable[Concatenate[Any, P], R]]:
+    """Validate the decorated method with both `prerun_validated` and `type_validated`, using a single wrapper.
+
+    This behaves the same as `type_validated(prerun_validated(validator_name)(function))`, but each call only goes
+    through one wrapper rather than two.
+
+    Args:
+        validator_name (str): The name of the method to call to validated the decorated method.
+        self_type (type | None): The class that the method is defined on, used to check `Self` annotations.
+    """
+
+    def outer(function: Callable[Concatenate[Any, P], R]) -> Callable[Concatenate[Any, P], R]:
+        return _build_validated(function, self_type, validator_name)
+
+    return outer
+
+
+def _build_validated(
+    function: Callable[P, R],
+    self_type: type | None,
+    validator_name: str | None,
+    check_types: bool = True,
+    kind: MethodKind = "method",
+    method_name: str | None = None,
+) -> Callable[P, R]:
+    """Build the wrapper for `prerun_validated`, `type_validated`, `prerun_type_validated` and `validated_method`.
+
+    Args:
+        function (Callable[P, R]): The method to validate.
+        self_type (type | None): The class that the method is defined on, used to check `Self` annotations.
+        validator_name (str | None): The name of the validation method to call on `self`, if there is one.
+        check_types (bool): Whether to check the argument and return types.
+        kind (MethodKind): Whether the method is a normal method, a classmethod or a staticmethod.
+        method_name (str | None): The name that the method is installed under, if it's installed on a class.
+    """
+    # Get the decorated function's name
+    function_name = function.__name__
+
+    # This is bascially getting the arguments and typehints for the function.
+    # The signature can't change after decoration, so it's only worked out once rather than on every call.
+    # A signature that's already been set on the function is used as it is, rather than being introspected again.
+    signature = getattr(function, "__signature__", None) or inspect.signature(function)
+    return_annotation = signature.return_annotation
+
+    # The expected type of each argument: dict[`argument_name`, `argument_expected_type`].
+    # Unannotated parameters (such as `self`) and `Any` parameters accept anything, so they're left out.
+    annotations: dict[str, Any] = {}
+
+    for name, parameter in signature.parameters.items():
+        if not check_types or parameter.annotation is inspect.Parameter.empty or parameter.annotation is Any:
+            continue
+
+        # `*args: int` means that args is a tuple of ints, and `**kwargs: int` means kwargs is a dict of ints.
+        if parameter.kind is parameter.VAR_POSITIONAL:
+            annotations[name] = tuple[parameter.annotation, ...]  # type: ignore[name-defined]
+        elif parameter.kind is parameter.VAR_KEYWORD:
+            annotations[name] = dict[str, parameter.annotation]  # type: ignore[name-defined]
+        else:
+            annotations[name] = parameter.annotation
+
+    # Unannotated and `Any` return values accept anything, so they don't need checking.
+    check_return = check_types and return_annotation is not inspect.Signature.empty and return_annotation is not Any
+
+    # If there's nothing that can fail a type check, and no validation method, then there's nothing to wrap.
+    if not annotations and not check_return and validator_name is None:
+        return function
+
+    # TypeCheckMemo is just typeguard's storage for info about an object.
+    # Forward references are resolved using the globals of the module that the method was defined in,
+    # which means it doesn't need rebuilding from the calling frame every call.
+    memo = TypeCheckMemo(inspect.unwrap(function).__globals__, {}, self_type=self_type)
+
+    # Read when the method is decorated, so that the setting can't change part way through.
+    # With no type checks to do, there's nothing to sample.
+    sample_every = SAMPLE_EVERY if annotations or check_return else 1
+
+    # The parameters are known up front, so a checker can be generated which doesn't need to bind them.
+    # Otherwise (e.g. if a parameter name clashes with the generated code) the arguments are bound on every call.
+    check_arguments = None
+
+    if annotations:
+        check_arguments = _generate_argument_checker(function_name, signature, annotations, memo)
+        if check_arguments is None:
+            check_arguments = _bind_argument_checker(function_name, signature, annotations, memo)
+
+    return _generate_validated(
+        function,
+        check_arguments,
+        memo,
+        validator_name,
+        sample_every,
+        return_annotation,
+        check_return,
+        kind,
+        self_type,
+        method_name,
+    )
+
+
+def is_validated_method(method: Any, owner: type) -> bool:
+    """Check whether a method found on `owner` has already been wrapped by `validated_method` for it.
+
+    Args:
+        method (Any): The method, as found on the class with `inspect.getattr_static`.
+        owner (type): The class that the method was found on.
+    """
+    function = method.__func__ if isinstance(method, (classmethod, staticmethod)) else method
+
+    if not getattr(function, "__is_validated_method__", False):
+        return False
+
+    # Static methods look up their validation method on the class they were wrapped for, so each class needs its own.
+    return getattr(function, "__validator_owner__", owner) is owner
+
+
+def validated_method(method: Any, name: str, owner: type, validator_name: str | None, check_types: bool) -> Any:
+    """Wrap a method that was found on `owner`, so that it can be installed on it.
+
+    Functions, and other callables which bind to instances in the same way (such as `functools.lru_cache` methods)
+    are wrapped directly. Classmethods and staticmethods have the function that they hold wrapped instead.
+    Classmethods look up their validation method on the class they're called on, and staticmethods on `owner`.
+
+    Args:
+        method (Any): The method, as found on the class with `inspect.getattr_static`.
+        name (str): The name of the method.
+        owner (type): The class that the wrapped method will be installed on.
+        validator_name (str | None): The name of the validation method, if the method is prerun validated.
+        check_types (bool): Whether to check the argument and return types.
+
+    Raises:
+        TypeError: Raised if the method isn't something that can be wrapped.
+
+    Returns:
+        Any: The wrapped method.
+    """
+    kind: MethodKind = "method"
+    function = method
+
+    if isinstance(method, classmethod):
+        kind = "classmethod"
+        function = method.__func__
+    elif isinstance(method, staticmethod):
+        kind = "staticmethod"
+        function = method.__func__
+
+    # A staticmethod that was wrapped for a parent class is rewrapped from the original function.
+    if getattr(function, "__is_validated_method__", False):
+        function = function.__wrapped__
+
+    if not callable(function) or (kind == "method" and not hasattr(type(function), "__get__")):
+        raise TypeError(f"The {name} attribute of {owner.__qualname__} can't be validated, as it isn't a method.")
+
+    try:
+        wrapped = _build_validated(function, owner, validator_name, check_types, kind, name)
+    except ValueError as error:
+        raise TypeError(f"The {name} attribute of {owner.__qualname__} can't be validated: {error}") from error
+
+    if kind == "method":
+        return wrapped
+
+    if kind == "staticmethod" and validator_name is not None:
+        wrapped.__validator_owner__ = owner  # type: ignore[attr-defined]
+
+    return type(method)(wrapped)
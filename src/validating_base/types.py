@@ -1,7 +1,9 @@
 """Types for the package."""
 
-from typing import ParamSpec, TypeVar  # pragma: no cover
+from typing import Literal, ParamSpec, TypeVar
 
-C = TypeVar("C")  # pragma: no cover
-P = ParamSpec("P")  # pragma: no cover
-R = TypeVar("R")  # pragma: no cover
+C = TypeVar("C")
+P = ParamSpec("P")
+R = TypeVar("R")
+
+MethodKind = Literal["method", "classmethod", "staticmethod"]
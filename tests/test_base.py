@@ -1,10 +1,13 @@
 """Example usages for the `validating_base.ValidatingBaseClass` class."""
 
+import functools
+import inspect
 from abc import abstractmethod
+from typing import Any
 
 import pytest
 from typeguard import TypeCheckError
-from validating_base import ValidatingBaseClass, validated
+from validating_base import ValidatingBaseClass, decorators_internal, prerun_validated, type_validated, validated
 
 
 class ActionExample(ValidatingBaseClass):
@@ -82,6 +85,235 @@ class MultiplierExample(ActionExample):
         return total
 
 
+class PositiveAdderExample(AdderExample):
+    """A class that only adds positive things."""
+
+    def validate_action(self, number_list: list[int]) -> None:
+        """Validate that all of the numbers are positive.
+
+        Args:
+            number_list (List[int]): The list of ints
+
+        Raises:
+            ValueError: Raised if any of the numbers are not positive
+        """
+        if any(number <= 0 for number in number_list):
+            raise ValueError("All numbers must be positive")
+
+
+class DefaultsExample(ValidatingBaseClass):
+    """A class with a validated method that has default arguments."""
+
+    def validate_action(self, number_list: list[int], start: int = 0, label: str = "total") -> None:
+        """Validated."""
+
+    @validated
+    def action(self, number_list: list[int], start: int = 0, label: str = "total") -> str:
+        """Sum the list, starting from `start`, and label the result."""
+        return f"{label}: {sum(number_list, start)}"
+
+
+class ParameterKindsExample(ValidatingBaseClass):
+    """A class with a validated method that uses each kind of parameter."""
+
+    @type_validated
+    def action(self, number: int, /, other: int = 0, *, label: str = "total") -> str:
+        """Add the numbers, and label the result."""
+        return f"{label}: {number + other}"
+
+    @type_validated
+    def variadic(self, *numbers: int, scale: int = 1, **labels: str) -> int:
+        """Add the numbers, and scale the result."""
+        return sum(numbers) * scale
+
+    @type_validated
+    def unannotated_return(self, number: int):  # type: ignore[no-untyped-def]  # noqa: ANN201
+        """Return the number, without saying so."""
+        return number
+
+    @type_validated
+    def returns_none(self, number: int) -> None:
+        """Return the number, despite saying that it returns None."""
+        return number  # type: ignore[return-value]
+
+    @type_validated
+    def untyped(self, value, other: Any = None):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201
+        """Return the value, which could be anything."""
+        return value
+
+
+class PrerunOnlyExample(ValidatingBaseClass):
+    """A class with a method that's validated by its validator, but doesn't have its types checked."""
+
+    def validate_action(self, number: int, *, scale: int = 1) -> None:
+        """Validate that the number isn't zero."""
+        if not number:
+            raise ValueError("number must not be zero")
+
+    @prerun_validated
+    def action(self, number: int, *, scale: int = 1) -> int:
+        """Scale the number."""
+        return number * scale
+
+    def validate_shifted(self, number: int) -> None:
+        """Validate that the number isn't zero, without taking the shift."""
+        if not number:
+            raise ValueError("number must not be zero")
+
+    @prerun_validated
+    def shifted(self, number: int, *, shift: int = 0) -> int:
+        """Shift the number."""
+        return number + shift
+
+
+class SelfInArgsExample(ValidatingBaseClass):
+    """A class with a validated method that doesn't name its `self` parameter."""
+
+    def validate_action(self, *numbers: int) -> None:
+        """Validate that there's at least one number."""
+        if not numbers:
+            raise ValueError("at least one number is needed")
+
+    @validated
+    def action(*args: Any) -> int:
+        """Add the numbers."""
+        return sum(args[1:])
+
+
+class MultipleValidatedExample(ValidatingBaseClass):
+    """A class with more than one validated method."""
+
+    def validate_first(self, number: int) -> None:
+        """Validate the first number."""
+        if number != 1:
+            raise ValueError("first must be 1")
+
+    def validate_second(self, number: int) -> None:
+        """Validate the second number."""
+        if number != 2:
+            raise ValueError("second must be 2")
+
+    @validated
+    def first(self, number: int) -> int:
+        """Return the number."""
+        return number
+
+    @validated
+    def second(self, number: int) -> int:
+        """Return the number."""
+        return number
+
+
+class CustomInitExample(PositiveAdderExample):
+    """A class that defines its own `__init__`."""
+
+    def __init__(self, start: int) -> None:
+        """Store the number to start adding from."""
+        super().__init__()
+        self.start = start
+
+
+class AdderMixin:
+    """A mixin, which isn't a `ValidatingBaseClass`, that adds things."""
+
+    def action(self, number_list: list[int]) -> int:
+        """Add the numbers."""
+        return sum(number_list)
+
+
+class MixinAdderExample(AdderMixin, PositiveAdderExample):
+    """A class that gets its implementation of the action method from a mixin."""
+
+
+class ClassMethodExample(ValidatingBaseClass):
+    """A class with a validated classmethod."""
+
+    @classmethod
+    def validate_action(cls: type[ValidatingBaseClass], number: int) -> None:
+        """Validate that the number isn't zero."""
+        if not number:
+            raise ValueError("number must not be zero")
+
+    @validated
+    @classmethod
+    def action(cls: type[ValidatingBaseClass], number: int) -> str:
+        """Label the number with the name of the class."""
+        return f"{cls.__name__}: {number}"
+
+
+class CountingExample(ValidatingBaseClass):
+    """A class that counts how many times its validator is called."""
+
+    validations: int = 0
+
+    def validate_action(self, number: int) -> None:
+        """Count the validation."""
+        self.validations += 1
+
+    @validated
+    def action(self, number: int) -> int:
+        """Return the number."""
+        return number
+
+
+class DoublingExample(CountingExample):
+    """A class that overrides a validated method, and calls the parent's version with `super`."""
+
+    def action(self, number: int) -> int:
+        """Double the number."""
+        return super().action(number) * 2
+
+
+class OptionalValidatorExample(ValidatingBaseClass):
+    """A class with validators that have different parameters to the methods that they validate."""
+
+    validator_arguments: list[Any] = []
+
+    def validate_scaled(self, number: int) -> None:
+        """Validate the number, without taking the scale."""
+        self.validator_arguments = [number]
+
+    def validate_labelled(self, number: int, label: str = "validator default") -> None:
+        """Validate the number and label, with a different default label."""
+        self.validator_arguments = [number, label]
+
+    @validated
+    def scaled(self, number: int, scale: int = 1) -> int:
+        """Scale the number."""
+        return number * scale
+
+    @validated
+    def labelled(self, number: int, label: str = "method default") -> str:
+        """Label the number."""
+        return f"{label}: {number}"
+
+    def validate_stepped(self, *args: Any, **kwargs: Any) -> None:
+        """Validate the arguments, exactly as they were passed."""
+        self.validator_arguments = [args, kwargs]
+
+    @validated
+    def stepped(self, number: int, step: int = 1) -> int:
+        """Step the number."""
+        return number + step
+
+
+def optional_number(self: Any, number: int = None) -> Any:  # type: ignore[assignment]
+    """Return the number."""
+    return number
+
+
+def optional_number_clashing(self: Any, number: int = None, __memo: Any = None) -> Any:  # type: ignore[assignment]
+    """Return the number, with a parameter name that clashes with the generated code."""
+    return number
+
+
+class OptionalNumberExample(ValidatingBaseClass):
+    """A class with the same method, once with a generated argument checker and once binding the arguments."""
+
+    generated = type_validated(optional_number)
+    bound = type_validated(optional_number_clashing)
+
+
 class InvalidExample(ActionExample):
     """A class that doesn't define an action method."""
 
@@ -138,6 +370,336 @@ def test_multiplier() -> None:
         multiplier.action(["1", 2, 3, 4, 5])  # type: ignore
 
 
+def test_overridden_validator() -> None:
+    """Tests that a validator overridden in a subclass is used for the inherited method."""
+    adder = PositiveAdderExample()
+
+    total = adder.action([1, 2, 3, 4, 5])
+    assert total == 15
+
+    with pytest.raises(ValueError, match="must be positive"):
+        adder.action([1, -2, 3])
+
+
+def test_wrapped_once() -> None:
+    """Tests that validated methods are wrapped once at class creation, not on every access."""
+    adder = AdderExample()
+
+    assert adder.action.__func__ is AdderExample.action  # type: ignore[attr-defined]
+    assert AdderExample().action.__func__ is adder.action.__func__  # type: ignore[attr-defined]
+    assert hasattr(AdderExample.action, "__wrapped__")
+
+    # Prerun and type validation are done by a single wrapper.
+    assert inspect.unwrap(AdderExample.action) is AdderExample.action.__wrapped__
+
+
+def test_default_arguments() -> None:
+    """Tests that arguments are checked against their own types when defaults are skipped."""
+    example = DefaultsExample()
+
+    assert example.action([1, 2], label="sum") == "sum: 3"
+    assert example.action([1, 2], 10) == "total: 13"
+
+    with pytest.raises(TypeCheckError, match='argument "label"'):
+        example.action([1, 2], label=3)  # type: ignore[arg-type]
+
+
+def test_validator_parameters() -> None:
+    """Tests that validators are only passed the arguments that were passed to the method."""
+    example = OptionalValidatorExample()
+
+    assert example.scaled(2) == 2
+    assert example.validator_arguments == [2]
+
+    assert example.scaled(number=3) == 3
+    assert example.validator_arguments == [3]
+
+    with pytest.raises(TypeError, match="unexpected keyword argument 'scale'"):
+        example.scaled(2, scale=3)
+
+    assert example.labelled(1) == "method default: 1"
+    assert example.validator_arguments == [1, "validator default"]
+
+    assert example.labelled(1, label="passed") == "passed: 1"
+    assert example.validator_arguments == [1, "passed"]
+
+
+def test_validator_argument_shape() -> None:
+    """Tests that validators are passed the arguments in the same way as the method was."""
+    example = OptionalValidatorExample()
+
+    assert example.stepped(number=2) == 3
+    assert example.validator_arguments == [(), {"number": 2}]
+
+    assert example.stepped(2, step=2) == 4
+    assert example.validator_arguments == [(2,), {"step": 2}]
+
+
+def test_passed_default_checked() -> None:
+    """Tests that arguments which are passed are checked, even if they're the same as the default."""
+    example = OptionalNumberExample()
+
+    for method in (example.generated, example.bound):
+        assert method() is None
+        assert method(1) == 1
+
+        with pytest.raises(TypeCheckError, match='argument "number"'):
+            method(None)  # type: ignore[arg-type]
+
+        with pytest.raises(TypeCheckError, match='argument "number"'):
+            method(number=None)  # type: ignore[arg-type]
+
+
+def test_parameter_kinds() -> None:
+    """Tests that validated methods accept arguments in the same ways as the original method."""
+    example = ParameterKindsExample()
+
+    assert example.action(1) == "total: 1"
+    assert example.action(1, 2, label="sum") == "sum: 3"
+
+    assert example.unannotated_return(1) == 1
+
+    with pytest.raises(TypeCheckError, match="the return value"):
+        example.returns_none(1)
+
+    assert example.untyped("anything") == "anything"
+    assert not hasattr(ParameterKindsExample.untyped, "__wrapped__")
+
+    assert example.variadic() == 0
+    assert example.variadic(1, 2, scale=2, name="sum") == 6
+
+    with pytest.raises(TypeCheckError, match='argument "numbers"'):
+        example.variadic("1", 2)  # type: ignore[arg-type]
+
+    with pytest.raises(TypeCheckError, match='argument "labels"'):
+        example.variadic(1, name=2)  # type: ignore[arg-type]
+
+    with pytest.raises(TypeError, match="positional-only"):
+        example.action(number=1)  # type: ignore[call-arg]
+
+    with pytest.raises(TypeError, match="positional argument"):
+        example.action(1, 2, "sum")  # type: ignore[call-arg]
+
+    with pytest.raises(TypeCheckError, match='argument "other"'):
+        example.action(1, "2")  # type: ignore[arg-type]
+
+
+def test_prerun_only() -> None:
+    """Tests that a prerun validated method is validated, but doesn't have its types checked."""
+    example = PrerunOnlyExample()
+
+    assert example.action(2, scale=3) == 6
+    assert example.action("a", scale=2) == "aa"  # type: ignore[arg-type,comparison-overlap]
+
+    with pytest.raises(ValueError, match="must not be zero"):
+        example.action(0)
+
+    # The validator only takes the arguments that it's passed, which don't include the defaults.
+    assert example.shifted(2) == 2
+
+    with pytest.raises(ValueError, match="must not be zero"):
+        example.shifted(0)
+
+    with pytest.raises(TypeError, match="unexpected keyword argument 'shift'"):
+        example.shifted(2, shift=1)
+
+
+def test_self_in_args() -> None:
+    """Tests that methods which don't name their `self` parameter are still validated."""
+    example = SelfInArgsExample()
+
+    assert example.action(1, 2, 3) == 6
+
+    with pytest.raises(ValueError, match="at least one number"):
+        example.action()
+
+
+def test_multiple_validated_methods() -> None:
+    """Tests that each validated method is wrapped with its own validator."""
+    example = MultipleValidatedExample()
+
+    assert example.first(1) == 1
+    assert example.second(2) == 2
+
+    with pytest.raises(ValueError, match="first must be 1"):
+        example.first(2)
+
+    with pytest.raises(ValueError, match="second must be 2"):
+        example.second(1)
+
+
+def test_inherited_init_wrapped_once() -> None:
+    """Tests that an inherited `__init__` isn't wrapped again by each subclass."""
+    assert AdderExample.__init__ is ValidatingBaseClass.__init__
+    assert PositiveAdderExample.__init__ is ValidatingBaseClass.__init__
+    assert getattr(CustomInitExample.__init__, "__is_validate_init__", False)
+
+    example = CustomInitExample(10)
+    assert example.start == 10
+    assert example._self_validated
+
+    with pytest.raises(ValueError, match="must be positive"):
+        example.action([-1])
+
+
+def test_sampled_type_checks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that only one in every `SAMPLE_EVERY` calls is type checked, but every call is validated."""
+    monkeypatch.setattr(decorators_internal, "SAMPLE_EVERY", 3)
+
+    class SampledExample(ValidatingBaseClass):
+        """A class that's defined while sampling is enabled."""
+
+        def validate_action(self, number_list: list[int]) -> None:
+            """Validate that the list isn't empty."""
+            if not number_list:
+                raise ValueError("number_list must not be empty")
+
+        @validated
+        def action(self, number_list: list[int]) -> int:
+            """Add the numbers."""
+            return len(number_list)
+
+    example = SampledExample()
+
+    with pytest.raises(TypeCheckError, match="is not an instance of int"):
+        example.action(["1"])  # type: ignore[list-item]
+
+    assert example.action(["1"]) == 1  # type: ignore[list-item]
+    assert example.action(["1"]) == 1  # type: ignore[list-item]
+
+    with pytest.raises(TypeCheckError, match="is not an instance of int"):
+        example.action(["1"])  # type: ignore[list-item]
+
+    with pytest.raises(ValueError, match="must not be empty"):
+        example.action([])
+
+
+def test_mixin_implementation() -> None:
+    """Tests that an implementation which comes from a mixin is validated."""
+    adder = MixinAdderExample()
+
+    assert adder.action([1, 2, 3]) == 6
+
+    with pytest.raises(ValueError, match="must be positive"):
+        adder.action([1, -2, 3])
+
+    with pytest.raises(TypeCheckError, match="is not an instance of int"):
+        adder.action(["1", 2, 3])  # type: ignore[list-item]
+
+
+def test_classmethod() -> None:
+    """Tests that a validated classmethod is validated, whether it's called on the class or an instance."""
+    example = ClassMethodExample()
+
+    assert example.action(1) == "ClassMethodExample: 1"
+    assert ClassMethodExample.action(2) == "ClassMethodExample: 2"
+
+    with pytest.raises(ValueError, match="must not be zero"):
+        ClassMethodExample.action(0)
+
+    with pytest.raises(TypeCheckError, match='argument "number"'):
+        example.action("1")  # type: ignore[arg-type]
+
+
+def test_classmethod_instance_validator() -> None:
+    """Tests that a validated classmethod with an instance method validator is an error when the class is created."""
+    with pytest.raises(TypeError, match="validate_action method must be a classmethod or staticmethod"):
+
+        class InstanceValidatorExample(ValidatingBaseClass):
+            """A class with a validated classmethod, but a normal validation method."""
+
+            def validate_action(self, number: int) -> None:
+                """Validated."""
+
+            @validated
+            @classmethod
+            def action(cls: type[ValidatingBaseClass], number: int) -> int:
+                """Return the number."""
+                return number
+
+    with pytest.raises(TypeError, match="validate_action method must be a classmethod or staticmethod"):
+
+        class InstanceValidatorSubclass(ClassMethodExample):
+            """A subclass which overrides the validation method with a normal method."""
+
+            def validate_action(self, number: int) -> None:  # type: ignore[override]
+                """Validated."""
+
+
+def test_unwrappable_method() -> None:
+    """Tests that a validated method which can't be wrapped is an error when the class is created."""
+    with pytest.raises(TypeError, match="can't be validated"):
+
+        class UnwrappableExample(ValidatingBaseClass):
+            """A class with a validated method that isn't a method."""
+
+            action = validated(functools.partial(sum))
+
+
+def test_super_validated_once() -> None:
+    """Tests that calling a validated method through `super` doesn't validate the call again."""
+    example = DoublingExample()
+
+    assert example.action(2) == 4
+    assert example.validations == 1
+
+    with pytest.raises(TypeCheckError, match='argument "number"'):
+        example.action("2")  # type: ignore[arg-type]
+
+    parent = CountingExample()
+
+    assert parent.action(2) == 2
+    assert parent.validations == 1
+
+
+def test_sampled_builtin_names(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that sampled methods and parameters can use the names of builtins."""
+    monkeypatch.setattr(decorators_internal, "SAMPLE_EVERY", 2)
+
+    class BuiltinNamesExample(ValidatingBaseClass):
+        """A class that's defined while sampling is enabled, with a method and parameter named after a builtin."""
+
+        @type_validated
+        def next(self, number: int) -> int:
+            """Return the next number."""
+            return number + 1
+
+        @type_validated
+        def after(self, next: int) -> int:
+            """Return the number after next."""
+            return next + 2
+
+    example = BuiltinNamesExample()
+
+    with pytest.raises(TypeCheckError, match='argument "number"'):
+        example.next("1")  # type: ignore[arg-type]
+
+    assert example.next(1) == 2
+    assert example.next(2) == 3
+
+    with pytest.raises(TypeCheckError, match='argument "next"'):
+        example.after("1")  # type: ignore[arg-type]
+
+    assert example.after(1) == 3
+    assert example.after(2) == 4
+
+
+def test_read_sample_every(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that the sampling environment variable is read, and that invalid values are reported."""
+    monkeypatch.delenv("VALIDATING_BASE_SAMPLE_EVERY", raising=False)
+    assert decorators_internal.read_sample_every() == 1
+
+    monkeypatch.setenv("VALIDATING_BASE_SAMPLE_EVERY", "10")
+    assert decorators_internal.read_sample_every() == 10
+
+    monkeypatch.setenv("VALIDATING_BASE_SAMPLE_EVERY", "0")
+    assert decorators_internal.read_sample_every() == 1
+
+    monkeypatch.setenv("VALIDATING_BASE_SAMPLE_EVERY", "ten")
+    with pytest.raises(ValueError, match="VALIDATING_BASE_SAMPLE_EVERY environment variable must be an integer"):
+        decorators_internal.read_sample_every()
+
+
 def test_missing_required() -> None:
     """Tests that a class with a missing requirement raises an error."""
     with pytest.raises(TypeError, match="Can't instantiate abstract class"):
@@ -149,6 +711,10 @@ def test_missing_validator() -> None:
     with pytest.raises(NotImplementedError, match="The validate_action method must be defined for the action method."):
         MissingValidator()
 
+    # A failed validation isn't remembered as a pass.
+    with pytest.raises(NotImplementedError, match="The validate_action method must be defined for the action method."):
+        MissingValidator()
+
 
 def test_non_callable_validator() -> None:
     """Tests a validator that is not callable."""